@@ -93,6 +93,7 @@ def parse_api(
     ensure_vals=None,
     only=None,
     skip=None,
+    prune=False,
 ) -> dict:
     """Get data from API."""
     debug = _LOGGER.getEffectiveLevel() == 10
@@ -102,13 +103,15 @@ def parse_api(
 
     if not source:
         if not key and not key_search:
-            data = fill_defaults(data, vals)
+            data = fill_defaults(data, compile_vals(vals))
         return data
 
     if debug:
         _LOGGER.debug("Processing source %s", async_redact_data(source, TO_REDACT))
 
     keymap = generate_keymap(data, key_search)
+    compiled_vals = compile_vals(vals) if vals else None
+    seen = set()
     for entry in source:
         if only and not matches_only(entry, only):
             continue
@@ -122,6 +125,7 @@ def parse_api(
             if not uid:
                 continue
 
+            seen.add(uid)
             if uid not in data:
                 data[uid] = {}
 
@@ -129,7 +133,7 @@ def parse_api(
             _LOGGER.debug("Processing entry %s", async_redact_data(entry, TO_REDACT))
 
         if vals:
-            data = fill_vals(data, entry, uid, vals)
+            data = fill_vals(data, entry, uid, compiled_vals)
 
         if ensure_vals:
             data = fill_ensure_vals(data, uid, ensure_vals)
@@ -137,6 +141,11 @@ def parse_api(
         if val_proc:
             data = fill_vals_proc(data, uid, val_proc)
 
+    # Remove entries no longer present in the source
+    if prune and (key or key_search):
+        for uid in [uid for uid in data if uid not in seen]:
+            del data[uid]
+
     return data
 
 
@@ -216,26 +225,43 @@ def can_skip(entry, skip) -> bool:
 
 
 # ---------------------------
-#   fill_defaults
+#   compile_vals
 # ---------------------------
-def fill_defaults(data, vals) -> dict:
-    """Fill defaults if source is not present."""
+def compile_vals(vals) -> list:
+    """Precompute value specs so per-entry processing skips the spec dicts."""
+    compiled = []
     for val in vals:
         _name = val["name"]
         _type = val["type"] if "type" in val else "str"
         _source = val["source"] if "source" in val else _name
+        _convert = val["convert"] if "convert" in val else None
 
         if _type == "str":
             _default = val["default"] if "default" in val else ""
             if "default_val" in val and val["default_val"] in val:
                 _default = val[val["default_val"]]
 
+            _reverse = False
+        else:
+            _default = val["default"] if "default" in val else False
+            _reverse = val["reverse"] if "reverse" in val else False
+
+        compiled.append((_name, _type, _source, _convert, _default, _reverse))
+
+    return compiled
+
+
+# ---------------------------
+#   fill_defaults
+# ---------------------------
+def fill_defaults(data, compiled_vals) -> dict:
+    """Fill defaults if source is not present."""
+    for _name, _type, _source, _convert, _default, _reverse in compiled_vals:
+        if _type == "str":
             if _name not in data:
                 data[_name] = from_entry([], _source, default=_default)
 
         elif _type == "bool":
-            _default = val["default"] if "default" in val else False
-            _reverse = val["reverse"] if "reverse" in val else False
             if _name not in data:
                 data[_name] = from_entry_bool(
                     [], _source, default=_default, reverse=_reverse
@@ -247,28 +273,16 @@ def fill_defaults(data, vals) -> dict:
 # ---------------------------
 #   fill_vals
 # ---------------------------
-def fill_vals(data, entry, uid, vals) -> dict:
+def fill_vals(data, entry, uid, compiled_vals) -> dict:
     """Fill all data."""
-    for val in vals:
-        _name = val["name"]
-        _type = val["type"] if "type" in val else "str"
-        _source = val["source"] if "source" in val else _name
-        _convert = val["convert"] if "convert" in val else None
-
+    for _name, _type, _source, _convert, _default, _reverse in compiled_vals:
         if _type == "str":
-            _default = val["default"] if "default" in val else ""
-            if "default_val" in val and val["default_val"] in val:
-                _default = val[val["default_val"]]
-
             if uid:
                 data[uid][_name] = from_entry(entry, _source, default=_default)
             else:
                 data[_name] = from_entry(entry, _source, default=_default)
 
         elif _type == "bool":
-            _default = val["default"] if "default" in val else False
-            _reverse = val["reverse"] if "reverse" in val else False
-
             if uid:
                 data[uid][_name] = from_entry_bool(
                     entry, _source, default=_default, reverse=_reverse
@@ -321,7 +335,7 @@ def fill_vals_proc(data, uid, vals_proc) -> dict:
     for val_sub in vals_proc:
         _name = None
         _action = None
-        _value = None
+        _parts = []
         for val in val_sub:
             if "name" in val:
                 _name = val["name"]
@@ -337,12 +351,12 @@ def fill_vals_proc(data, uid, vals_proc) -> dict:
             if _action == "combine":
                 if "key" in val:
                     tmp = _data[val["key"]] if val["key"] in _data else "unknown"
-                    _value = f"{_value}{tmp}" if _value else tmp
+                    _parts.append(f"{tmp}")
 
                 if "text" in val:
-                    tmp = val["text"]
-                    _value = f"{_value}{tmp}" if _value else tmp
+                    _parts.append(val["text"])
 
+        _value = "".join(_parts)
         if _name and _value:
             if uid:
                 data[uid][_name] = _value
@@ -54,4 +54,6 @@ class MikrotikScriptButton(MikrotikButton):
 
     async def async_press(self) -> None:
         """Process the button press."""
-        self.coordinator.run_script(self._data["name"])
+        await self.hass.async_add_executor_job(
+            self.coordinator.run_script, self._data["name"]
+        )
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import ipaddress
 import logging
 import re
 import pytz
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from ipaddress import ip_address, IPv4Network
@@ -71,6 +73,27 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_TIME_ZONE = None
 
+API_EXECUTOR_MAX_WORKERS = 4
+
+HWINFO_REFRESH_INTERVAL = 60 * 60 * 4
+FWUPDATE_CHECK_INTERVAL = 60 * 60 * 4
+
+UPTIME_FACTORS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+HOST_DEFAULTS = (
+    ("address", "unknown"),
+    ("mac-address", "unknown"),
+    ("interface", "unknown"),
+    ("host-name", "unknown"),
+    ("manufacturer", "detect"),
+    ("last-seen", False),
+    ("available", False),
+)
+
+TRACKER_HOST_DEFAULTS = tuple(
+    (key, default) for key, default in HOST_DEFAULTS if key != "manufacturer"
+)
+
 
 def is_valid_ip(address):
     try:
@@ -95,7 +118,7 @@ def as_local(dattim: datetime) -> datetime:
     return dattim.astimezone(DEFAULT_TIME_ZONE)
 
 
-@dataclass
+@dataclass(slots=True)
 class MikrotikData:
     """Data for the mikrotik integration."""
 
@@ -154,17 +177,7 @@ class MikrotikTrackerCoordinator(DataUpdateCoordinator[None]):
         for uid in list(self.coordinator.ds["host"]):
             if not self.coordinator.host_tracking_initialized:
                 # Add missing default values
-                for key, default in zip(
-                    [
-                        "address",
-                        "mac-address",
-                        "interface",
-                        "host-name",
-                        "last-seen",
-                        "available",
-                    ],
-                    ["unknown", "unknown", "unknown", "unknown", False, False],
-                ):
+                for key, default in TRACKER_HOST_DEFAULTS:
                     if key not in self.coordinator.ds["host"][uid]:
                         self.coordinator.ds["host"][uid][key] = default
 
@@ -265,6 +278,10 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
 
         self.notified_flags = []
 
+        self.ds_revision = {}
+        self._ds_fingerprint = {}
+        self._iface_name_to_uid = None
+
         self.api = MikrotikAPI(
             config_entry.data[CONF_HOST],
             config_entry.data[CONF_USERNAME],
@@ -295,7 +312,15 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         self.async_mac_lookup = AsyncMacLookup()
         self.accessrights_reported = False
 
+        # Dedicated pool for the update fanout, so concurrent getters
+        # do not saturate the shared Home Assistant executor
+        self._api_executor = ThreadPoolExecutor(
+            max_workers=API_EXECUTOR_MAX_WORKERS,
+            thread_name_prefix=f"mikrotik_{self.name}",
+        )
+
         self.last_hwinfo_update = datetime(1970, 1, 1)
+        self.last_fwupdate_check = datetime(1970, 1, 1)
 
     # ---------------------------
     #   option_track_iface_clients
@@ -438,6 +463,19 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         )
         return timedelta(seconds=scan_interval)
 
+    # ---------------------------
+    #   iface_name_to_uid
+    # ---------------------------
+    @property
+    def iface_name_to_uid(self) -> dict:
+        """Map interface name to uid, rebuilt after each interface refresh"""
+        if self._iface_name_to_uid is None:
+            self._iface_name_to_uid = {
+                vals["name"]: uid for uid, vals in self.ds["interface"].items()
+            }
+
+        return self._iface_name_to_uid
+
     # ---------------------------
     #   connected
     # ---------------------------
@@ -529,9 +567,9 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             self.support_gps = True
 
     # ---------------------------
-    #   async_get_host_hass
+    #   get_host_hass
     # ---------------------------
-    async def async_get_host_hass(self):
+    def get_host_hass(self):
         """Get host data from HA entity registry"""
         registry = entity_registry.async_get(self.hass)
         for entity in registry.entities.values():
@@ -557,10 +595,13 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     async def _async_update_data(self):
         """Update Mikrotik data"""
         delta = datetime.now().replace(microsecond=0) - self.last_hwinfo_update
-        if self.api.has_reconnected() or delta.total_seconds() > 60 * 60 * 4:
+        hwinfo_expired = delta.total_seconds() > HWINFO_REFRESH_INTERVAL
+        if self.api.has_reconnected() or hwinfo_expired:
             await self.hass.async_add_executor_job(self.get_access)
 
-            if self.api.connected():
+            # Slow check-for-updates call, run on schedule only and
+            # not on every reconnect
+            if self.api.connected() and hwinfo_expired:
                 await self.hass.async_add_executor_job(self.get_firmware_update)
 
             if self.api.connected():
@@ -587,36 +628,68 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             if self.api.connected():
                 self.last_hwinfo_update = datetime.now().replace(microsecond=0)
 
-        await self.hass.async_add_executor_job(self.get_system_resource)
-
         # if self.api.connected() and "available" not in self.ds["fw-update"]:
         #     await self.hass.async_add_executor_job(self.get_firmware_update)
 
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_system_health)
+        # ARP data feeds interface client matching, host tracking and
+        # the host entries behind the client traffic sensors
+        track_clients = (
+            self.option_track_iface_clients
+            or self.option_track_network_hosts
+            or self.option_sensor_client_traffic
+        )
 
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_dhcp_client)
+        # Fetch independent endpoints in one API batch to save round trips
+        batch_paths = [
+            "/system/resource",
+            "/ip/dhcp-client",
+        ]
+        if track_clients:
+            batch_paths.append("/interface/bridge/host")
+        if self.support_capsman:
+            batch_paths.append("/caps-man/registration-table")
 
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_interface)
+        wifimodule = "wifiwave2" if self.support_wifiwave2 else "wireless"
+        if self.support_wireless:
+            batch_paths.append(f"/interface/{wifimodule}/registration-table")
 
-        if self.api.connected() and not self.ds["host_hass"]:
-            await self.async_get_host_hass()
+        batch = (
+            await self.hass.async_add_executor_job(self.api.query_many, batch_paths)
+            or {}
+        )
 
-        if self.api.connected() and self.support_capsman:
-            await self.hass.async_add_executor_job(self.get_capsman_hosts)
+        # Process batched endpoints concurrently
+        jobs = [
+            (self.get_system_resource, batch.get("/system/resource")),
+            self.get_system_health,
+            (self.get_dhcp_client, batch.get("/ip/dhcp-client")),
+            self.get_interface,
+        ]
+        if track_clients:
+            jobs.append((self.get_bridge, batch.get("/interface/bridge/host")))
 
-        if self.api.connected() and self.support_wireless:
-            await self.hass.async_add_executor_job(self.get_wireless)
+        if self.support_capsman:
+            jobs.append(
+                (self.get_capsman_hosts, batch.get("/caps-man/registration-table"))
+            )
 
-        if self.api.connected() and self.support_wireless:
-            await self.hass.async_add_executor_job(self.get_wireless_hosts)
+        if self.support_wireless:
+            jobs.append(
+                (
+                    self.get_wireless_hosts,
+                    batch.get(f"/interface/{wifimodule}/registration-table"),
+                )
+            )
 
-        if self.api.connected():
-            await self.hass.async_add_executor_job(self.get_bridge)
+        await self.async_gather_jobs(jobs)
 
-        if self.api.connected():
+        if self.api.connected() and not self.ds["host_hass"]:
+            self.get_host_hass()
+
+        if self.api.connected() and self.support_wireless:
+            await self.hass.async_add_executor_job(self.get_wireless)
+
+        if self.api.connected() and track_clients:
             await self.hass.async_add_executor_job(self.get_arp)
 
         if self.api.connected():
@@ -628,51 +701,99 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         if self.api.connected():
             await self.hass.async_add_executor_job(self.process_interface_client)
 
-        if self.api.connected() and self.option_sensor_nat:
-            await self.hass.async_add_executor_job(self.get_nat)
+        # Fetch independent optional endpoints concurrently
+        jobs = []
+        if self.option_sensor_nat:
+            jobs.append(self.get_nat)
 
-        if self.api.connected() and self.option_sensor_kidcontrol:
-            await self.hass.async_add_executor_job(self.get_kidcontrol)
+        if self.option_sensor_kidcontrol:
+            jobs.append(self.get_kidcontrol)
 
-        if self.api.connected() and self.option_sensor_mangle:
-            await self.hass.async_add_executor_job(self.get_mangle)
+        if self.option_sensor_mangle:
+            jobs.append(self.get_mangle)
 
-        if self.api.connected() and self.option_sensor_filter:
-            await self.hass.async_add_executor_job(self.get_filter)
+        if self.option_sensor_filter:
+            jobs.append(self.get_filter)
 
-        if self.api.connected() and self.option_sensor_netwatch:
-            await self.hass.async_add_executor_job(self.get_netwatch)
+        if self.option_sensor_netwatch:
+            jobs.append(self.get_netwatch)
 
-        if self.api.connected() and self.support_ppp and self.option_sensor_ppp:
-            await self.hass.async_add_executor_job(self.get_ppp)
+        if self.support_ppp and self.option_sensor_ppp:
+            jobs.append(self.get_ppp)
 
-        if self.api.connected() and self.option_sensor_client_traffic:
+        if self.option_sensor_client_traffic:
             if 0 < self.major_fw_version < 7:
-                await self.hass.async_add_executor_job(self.process_accounting)
+                jobs.append(self.process_accounting)
             elif 0 < self.major_fw_version >= 7:
-                await self.hass.async_add_executor_job(self.process_kid_control_devices)
+                jobs.append(self.process_kid_control_devices)
 
-        if self.api.connected() and self.option_sensor_client_captive:
-            await self.hass.async_add_executor_job(self.get_captive)
+        if self.option_sensor_client_captive:
+            jobs.append(self.get_captive)
 
-        if self.api.connected() and self.option_sensor_simple_queues:
-            await self.hass.async_add_executor_job(self.get_queue)
+        if self.option_sensor_simple_queues:
+            jobs.append(self.get_queue)
 
-        if self.api.connected() and self.option_sensor_environment:
-            await self.hass.async_add_executor_job(self.get_environment)
+        if self.option_sensor_environment:
+            jobs.append(self.get_environment)
 
-        if self.api.connected() and self.support_ups:
-            await self.hass.async_add_executor_job(self.get_ups)
+        if self.support_ups:
+            jobs.append(self.get_ups)
 
-        if self.api.connected() and self.support_gps:
-            await self.hass.async_add_executor_job(self.get_gps)
+        if self.support_gps:
+            jobs.append(self.get_gps)
+
+        if self.api.connected() and jobs:
+            await self.async_gather_jobs(jobs)
 
         if not self.api.connected():
             raise UpdateFailed("Mikrotik Disconnected")
 
+        # Fingerprint on the event loop, the tracker coordinator mutates
+        # the host section from the loop while executor threads iterate
+        self.update_revisions()
+
         # async_dispatcher_send(self.hass, "update_sensors", self)
         return self.ds
 
+    # ---------------------------
+    #   update_revisions
+    # ---------------------------
+    def update_revisions(self) -> None:
+        """Bump revision for data sections which changed since last refresh"""
+        for section, values in self.ds.items():
+            fingerprint = hash(repr(values))
+            if self._ds_fingerprint.get(section) != fingerprint:
+                self._ds_fingerprint[section] = fingerprint
+                self.ds_revision[section] = self.ds_revision.get(section, 0) + 1
+
+    # ---------------------------
+    #   async_gather_jobs
+    # ---------------------------
+    async def async_gather_jobs(self, jobs) -> None:
+        """Run independent data getters concurrently in the executor.
+
+        Jobs are callables, optionally tuples of callable and arguments.
+        """
+        if not self.api.connected():
+            return
+
+        tasks = []
+        for job in jobs:
+            if isinstance(job, tuple):
+                tasks.append(self.hass.loop.run_in_executor(self._api_executor, *job))
+            else:
+                tasks.append(self.hass.loop.run_in_executor(self._api_executor, job))
+
+        await asyncio.gather(*tasks)
+
+    # ---------------------------
+    #   async_shutdown
+    # ---------------------------
+    async def async_shutdown(self) -> None:
+        """Shut down the coordinator and its API executor"""
+        await super().async_shutdown()
+        self._api_executor.shutdown(wait=False)
+
     # ---------------------------
     #   get_access
     # ---------------------------
@@ -880,14 +1001,20 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                         ],
                     )
 
+        # Interface names may have changed
+        self._iface_name_to_uid = None
+
     # ---------------------------
     #   get_bridge
     # ---------------------------
-    def get_bridge(self) -> None:
+    def get_bridge(self, source=None) -> None:
         """Get system resources data from Mikrotik"""
+        if source is None:
+            source = self.api.query("/interface/bridge/host")
+
         self.ds["bridge_host"] = parse_api(
             data=self.ds["bridge_host"],
-            source=self.api.query("/interface/bridge/host"),
+            source=source,
             key="mac-address",
             vals=[
                 {"name": "mac-address"},
@@ -917,25 +1044,29 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 self.ds["interface"][uid]["client-mac-address"] = "disabled"
             return
 
-        for uid, vals in self.ds["interface"].items():
+        name2uid = self.iface_name_to_uid
+        for uid in self.ds["interface"]:
             self.ds["interface"][uid]["client-ip-address"] = ""
             self.ds["interface"][uid]["client-mac-address"] = ""
-            for arp_uid, arp_vals in self.ds["arp"].items():
-                if arp_vals["interface"] != vals["name"]:
-                    continue
 
-                if self.ds["interface"][uid]["client-ip-address"] == "":
-                    self.ds["interface"][uid]["client-ip-address"] = arp_vals["address"]
-                else:
-                    self.ds["interface"][uid]["client-ip-address"] = "multiple"
+        for arp_vals in self.ds["arp"].values():
+            uid = name2uid.get(arp_vals["interface"])
+            if uid is None:
+                continue
 
-                if self.ds["interface"][uid]["client-mac-address"] == "":
-                    self.ds["interface"][uid]["client-mac-address"] = arp_vals[
-                        "mac-address"
-                    ]
-                else:
-                    self.ds["interface"][uid]["client-mac-address"] = "multiple"
+            if self.ds["interface"][uid]["client-ip-address"] == "":
+                self.ds["interface"][uid]["client-ip-address"] = arp_vals["address"]
+            else:
+                self.ds["interface"][uid]["client-ip-address"] = "multiple"
+
+            if self.ds["interface"][uid]["client-mac-address"] == "":
+                self.ds["interface"][uid]["client-mac-address"] = arp_vals[
+                    "mac-address"
+                ]
+            else:
+                self.ds["interface"][uid]["client-mac-address"] = "multiple"
 
+        for uid in self.ds["interface"]:
             if self.ds["interface"][uid]["client-ip-address"] == "":
                 self.ds["interface"][uid]["client-ip-address"] = "none"
 
@@ -969,44 +1100,24 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                     "reverse": True,
                 },
             ],
-            val_proc=[
-                [
-                    {"name": "uniq-id"},
-                    {"action": "combine"},
-                    {"key": "chain"},
-                    {"text": ","},
-                    {"key": "action"},
-                    {"text": ","},
-                    {"key": "protocol"},
-                    {"text": ","},
-                    {"key": "in-interface"},
-                    {"text": ":"},
-                    {"key": "dst-port"},
-                    {"text": "-"},
-                    {"key": "out-interface"},
-                    {"text": ":"},
-                    {"key": "to-addresses"},
-                    {"text": ":"},
-                    {"key": "to-ports"},
-                ],
-                [
-                    {"name": "name"},
-                    {"action": "combine"},
-                    {"key": "protocol"},
-                    {"text": ":"},
-                    {"key": "dst-port"},
-                ],
-            ],
             only=[{"key": "action", "value": "dst-nat"}],
+            prune=True,
         )
 
         # Remove duplicate NAT entries to prevent crash
         nat_uniq = {}
         nat_del = {}
         for uid in self.ds["nat"]:
-            self.ds["nat"][uid]["comment"] = str(self.ds["nat"][uid]["comment"])
+            vals = self.ds["nat"][uid]
+            vals["comment"] = str(vals["comment"])
+            vals["uniq-id"] = (
+                f"{vals['chain']},{vals['action']},{vals['protocol']},"
+                f"{vals['in-interface']}:{vals['dst-port']}-"
+                f"{vals['out-interface']}:{vals['to-addresses']}:{vals['to-ports']}"
+            )
+            vals["name"] = f"{vals['protocol']}:{vals['dst-port']}"
 
-            tmp_name = self.ds["nat"][uid]["uniq-id"]
+            tmp_name = vals["uniq-id"]
             if tmp_name not in nat_uniq:
                 nat_uniq[tmp_name] = uid
             else:
@@ -1423,15 +1534,18 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     # ---------------------------
     #   get_system_resource
     # ---------------------------
-    def get_system_resource(self) -> None:
+    def get_system_resource(self, source=None) -> None:
         """Get system resources data from Mikrotik"""
+        if source is None:
+            source = self.api.query("/system/resource")
+
         tmp_rebootcheck = 0
         if "uptime_epoch" in self.ds["resource"]:
             tmp_rebootcheck = self.ds["resource"]["uptime_epoch"]
 
         self.ds["resource"] = parse_api(
             data=self.ds["resource"],
-            source=self.api.query("/system/resource"),
+            source=source,
             vals=[
                 {"name": "platform", "default": "unknown"},
                 {"name": "board-name", "default": "unknown"},
@@ -1452,69 +1566,49 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             ],
         )
 
+        resource = self.ds["resource"]
+
         tmp_uptime = 0
-        tmp = re.split(r"(\d+)[s]", self.ds["resource"]["uptime_str"])
-        if len(tmp) > 1:
-            tmp_uptime += int(tmp[1])
-        tmp = re.split(r"(\d+)[m]", self.ds["resource"]["uptime_str"])
-        if len(tmp) > 1:
-            tmp_uptime += int(tmp[1]) * 60
-        tmp = re.split(r"(\d+)[h]", self.ds["resource"]["uptime_str"])
-        if len(tmp) > 1:
-            tmp_uptime += int(tmp[1]) * 3600
-        tmp = re.split(r"(\d+)[d]", self.ds["resource"]["uptime_str"])
-        if len(tmp) > 1:
-            tmp_uptime += int(tmp[1]) * 86400
-        tmp = re.split(r"(\d+)[w]", self.ds["resource"]["uptime_str"])
-        if len(tmp) > 1:
-            tmp_uptime += int(tmp[1]) * 604800
-
-        self.ds["resource"]["uptime_epoch"] = tmp_uptime
+        for factor, unit in re.findall(r"(\d+)([wdhms])", resource["uptime_str"]):
+            tmp_uptime += int(factor) * UPTIME_FACTORS[unit]
+
+        resource["uptime_epoch"] = tmp_uptime
         now = datetime.now().replace(microsecond=0)
         uptime_tm = datetime.timestamp(now - timedelta(seconds=tmp_uptime))
         update_uptime = False
-        if not self.ds["resource"]["uptime"]:
+        if not resource["uptime"]:
             update_uptime = True
         else:
-            uptime_old = datetime.timestamp(self.ds["resource"]["uptime"])
+            uptime_old = datetime.timestamp(resource["uptime"])
             if uptime_tm > uptime_old + 10:
                 update_uptime = True
 
         if update_uptime:
-            self.ds["resource"]["uptime"] = utc_from_timestamp(uptime_tm)
+            resource["uptime"] = utc_from_timestamp(uptime_tm)
 
-        if self.ds["resource"]["total-memory"] > 0:
-            self.ds["resource"]["memory-usage"] = round(
+        if resource["total-memory"] > 0:
+            resource["memory-usage"] = round(
                 (
-                    (
-                        self.ds["resource"]["total-memory"]
-                        - self.ds["resource"]["free-memory"]
-                    )
-                    / self.ds["resource"]["total-memory"]
+                    (resource["total-memory"] - resource["free-memory"])
+                    / resource["total-memory"]
                 )
                 * 100
             )
         else:
-            self.ds["resource"]["memory-usage"] = "unknown"
+            resource["memory-usage"] = "unknown"
 
-        if self.ds["resource"]["total-hdd-space"] > 0:
-            self.ds["resource"]["hdd-usage"] = round(
+        if resource["total-hdd-space"] > 0:
+            resource["hdd-usage"] = round(
                 (
-                    (
-                        self.ds["resource"]["total-hdd-space"]
-                        - self.ds["resource"]["free-hdd-space"]
-                    )
-                    / self.ds["resource"]["total-hdd-space"]
+                    (resource["total-hdd-space"] - resource["free-hdd-space"])
+                    / resource["total-hdd-space"]
                 )
                 * 100
             )
         else:
-            self.ds["resource"]["hdd-usage"] = "unknown"
+            resource["hdd-usage"] = "unknown"
 
-        if (
-            "uptime_epoch" in self.ds["resource"]
-            and 0 < tmp_rebootcheck < self.ds["resource"]["uptime_epoch"]
-        ):
+        if 0 < tmp_rebootcheck < resource["uptime_epoch"]:
             self.get_firmware_update()
 
     # ---------------------------
@@ -1529,6 +1623,13 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
         ):
             return
 
+        # Cache result, check-for-updates is slow and hits Mikrotik servers
+        delta = datetime.now().replace(microsecond=0) - self.last_fwupdate_check
+        if delta.total_seconds() < FWUPDATE_CHECK_INTERVAL:
+            return
+
+        self.last_fwupdate_check = datetime.now().replace(microsecond=0)
+
         self.execute(
             "/system/package/update", "check-for-updates", None, None, {"duration": 10}
         )
@@ -1657,6 +1758,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 {"name": "last-started", "default": "unknown"},
                 {"name": "run-count", "default": "unknown"},
             ],
+            prune=True,
         )
 
     # ---------------------------
@@ -1786,24 +1888,18 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             key="mac-address",
             vals=[{"name": "mac-address"}, {"name": "address"}, {"name": "interface"}],
             ensure_vals=[{"name": "bridge", "default": ""}],
+            prune=True,
         )
 
-        for uid, vals in self.ds["arp"].items():
+        dhcp_client = self.ds["dhcp-client"]
+        for uid in list(self.ds["arp"]):
+            vals = self.ds["arp"][uid]
             if vals["interface"] in self.ds["bridge"] and uid in self.ds["bridge_host"]:
-                self.ds["arp"][uid]["bridge"] = vals["interface"]
-                self.ds["arp"][uid]["interface"] = self.ds["bridge_host"][uid][
-                    "interface"
-                ]
-
-        if self.ds["dhcp-client"]:
-            to_remove = [
-                uid
-                for uid, vals in self.ds["arp"].items()
-                if vals["interface"] in self.ds["dhcp-client"]
-            ]
+                vals["bridge"] = vals["interface"]
+                vals["interface"] = self.ds["bridge_host"][uid]["interface"]
 
-            for uid in to_remove:
-                self.ds["arp"].pop(uid)
+            if dhcp_client and vals["interface"] in dhcp_client:
+                del self.ds["arp"][uid]
 
     # ---------------------------
     #   get_dns
@@ -1910,11 +2006,14 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     # ---------------------------
     #   get_dhcp_client
     # ---------------------------
-    def get_dhcp_client(self) -> None:
+    def get_dhcp_client(self, source=None) -> None:
         """Get DHCP client data from Mikrotik"""
+        if source is None:
+            source = self.api.query("/ip/dhcp-client")
+
         self.ds["dhcp-client"] = parse_api(
             data=self.ds["dhcp-client"],
-            source=self.api.query("/ip/dhcp-client"),
+            source=source,
             key="interface",
             vals=[
                 {"name": "interface", "default": "unknown"},
@@ -1950,11 +2049,14 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     # ---------------------------
     #   get_capsman_hosts
     # ---------------------------
-    def get_capsman_hosts(self) -> None:
+    def get_capsman_hosts(self, source=None) -> None:
         """Get CAPS-MAN hosts data from Mikrotik"""
+        if source is None:
+            source = self.api.query("/caps-man/registration-table")
+
         self.ds["capsman_hosts"] = parse_api(
             data={},
-            source=self.api.query("/caps-man/registration-table"),
+            source=source,
             key="mac-address",
             vals=[
                 {"name": "mac-address"},
@@ -2016,12 +2118,15 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
     # ---------------------------
     #   get_wireless_hosts
     # ---------------------------
-    def get_wireless_hosts(self) -> None:
+    def get_wireless_hosts(self, source=None) -> None:
         """Get wireless hosts data from Mikrotik"""
-        wifimodule = "wifiwave2" if self.support_wifiwave2 else "wireless"
+        if source is None:
+            wifimodule = "wifiwave2" if self.support_wifiwave2 else "wireless"
+            source = self.api.query(f"/interface/{wifimodule}/registration-table")
+
         self.ds["wireless_hosts"] = parse_api(
             data={},
-            source=self.api.query(f"/interface/{wifimodule}/registration-table"),
+            source=source,
             key="mac-address",
             vals=[
                 {"name": "mac-address"},
@@ -2103,18 +2208,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
 
         for uid, vals in self.ds["host"].items():
             # Add missing default values
-            for key, default in zip(
-                [
-                    "address",
-                    "mac-address",
-                    "interface",
-                    "host-name",
-                    "manufacturer",
-                    "last-seen",
-                    "available",
-                ],
-                ["unknown", "unknown", "unknown", "unknown", "detect", False, False],
-            ):
+            for key, default in HOST_DEFAULTS:
                 if key not in self.ds["host"][uid]:
                     self.ds["host"][uid][key] = default
 
@@ -2260,7 +2354,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 }
 
         _LOGGER.debug(
-            f"Working with {len(self.ds['client_traffic'])} accounting devices"
+            "Working with %s accounting devices", len(self.ds["client_traffic"])
         )
 
         # Build temp accounting values dict with ip address as key
@@ -2293,16 +2387,19 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
 
             if entry_count == threshold:
                 _LOGGER.warning(
-                    f"Accounting entries count reached the threshold of {threshold}!"
+                    "Accounting entries count reached the threshold of %s!"
                     " Some entries were not saved by Mikrotik so accounting calculation won't be correct."
                     " Consider shortening update interval or"
-                    " increasing the accounting threshold value in Mikrotik."
+                    " increasing the accounting threshold value in Mikrotik.",
+                    threshold,
                 )
             elif entry_count > threshold * 0.9:
                 _LOGGER.info(
-                    f"Accounting entries count ({entry_count} reached 90% of the threshold,"
-                    f" currently set to {threshold}! Consider shortening update interval or"
-                    " increasing the accounting threshold value in Mikrotik."
+                    "Accounting entries count (%s reached 90%% of the threshold,"
+                    " currently set to %s! Consider shortening update interval or"
+                    " increasing the accounting threshold value in Mikrotik.",
+                    entry_count,
+                    threshold,
                 )
 
             for item in accounting_data.values():
@@ -2338,7 +2435,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
             uid = self._get_accounting_uid_by_ip(addr)
             if not uid:
                 _LOGGER.warning(
-                    f"Address {addr} not found in accounting data, skipping update"
+                    "Address %s not found in accounting data, skipping update", addr
                 )
                 continue
 
@@ -2386,19 +2483,6 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 return mac
         return None
 
-    # ---------------------------
-    #   _get_iface_from_entry
-    # ---------------------------
-    def _get_iface_from_entry(self, entry):
-        """Get interface default-name using name from interface dict"""
-        uid = None
-        for ifacename in self.ds["interface"]:
-            if self.ds["interface"][ifacename]["name"] == entry["interface"]:
-                uid = ifacename
-                break
-
-        return uid
-
     # ---------------------------
     #   process_kid_control
     # ---------------------------
@@ -2421,7 +2505,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
                 }
 
         _LOGGER.debug(
-            f"Working with {len(self.ds['client_traffic'])} kid control devices"
+            "Working with %s kid control devices", len(self.ds["client_traffic"])
         )
 
         kid_control_devices_data = parse_api(
@@ -2455,7 +2539,7 @@ class MikrotikCoordinator(DataUpdateCoordinator[None]):
 
         for uid, vals in kid_control_devices_data.items():
             if uid not in self.ds["client_traffic"]:
-                _LOGGER.debug(f"Skipping unknown device {uid}")
+                _LOGGER.debug("Skipping unknown device %s", uid)
                 continue
 
             self.ds["client_traffic"][uid]["available"] = vals["enabled"]
@@ -12,13 +12,18 @@ async def async_get_config_entry_diagnostics(
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     data_coordinator = hass.data[DOMAIN][config_entry.entry_id].data_coordinator
-    tracker_coordinator = hass.data[DOMAIN][config_entry.entry_id].data_coordinator
+    tracker_coordinator = hass.data[DOMAIN][config_entry.entry_id].tracker_coordinator
 
     return {
         "entry": {
             "data": async_redact_data(config_entry.data, TO_REDACT),
             "options": async_redact_data(config_entry.options, TO_REDACT),
         },
+        "stats": {
+            "api": data_coordinator.api.stats,
+            "tracker_api": tracker_coordinator.api.stats,
+            "ds_revision": data_coordinator.ds_revision,
+        },
         "data": async_redact_data(data_coordinator.data, TO_REDACT),
         "tracker": async_redact_data(tracker_coordinator.data, TO_REDACT),
     }
@@ -177,6 +177,9 @@ class MikrotikEntity(CoordinatorEntity[_MikrotikCoordinatorT], Entity):
         self._config_entry = self.coordinator.config_entry
         self._attr_extra_state_attributes = {ATTR_ATTRIBUTION: ATTRIBUTION}
         self._uid = uid
+        self._data_revision = None
+        self._data_success = None
+        self._data_missing = False
         self._data = coordinator.data[self.entity_description.data_path]
         if self._uid:
             self._data = coordinator.data[self.entity_description.data_path][self._uid]
@@ -185,13 +188,37 @@ class MikrotikEntity(CoordinatorEntity[_MikrotikCoordinatorT], Entity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self._data = self.coordinator.data[self.entity_description.data_path]
+        # Skip state write when the data section and availability
+        # did not change since last refresh
+        revision = getattr(self.coordinator, "ds_revision", {}).get(
+            self.entity_description.data_path
+        )
+        success = self.coordinator.last_update_success
+        if (
+            revision is not None
+            and revision == self._data_revision
+            and success == self._data_success
+        ):
+            return
+
+        self._data_revision = revision
+        self._data_success = success
+        section = self.coordinator.data[self.entity_description.data_path]
         if self._uid:
-            self._data = self.coordinator.data[self.entity_description.data_path][
-                self._uid
-            ]
+            # Entry can be pruned from the section while the entity remains,
+            # keep the last data and report the entity as unavailable
+            self._data_missing = self._uid not in section
+            if not self._data_missing:
+                self._data = section[self._uid]
+        else:
+            self._data = section
         super()._handle_coordinator_update()
 
+    @property
+    def available(self) -> bool:
+        """Return if entity is available"""
+        return super().available and not self._data_missing
+
     @property
     def custom_name(self) -> str:
         """Return the name for this entity"""
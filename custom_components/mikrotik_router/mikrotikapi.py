@@ -21,6 +21,27 @@ _LOGGER = logging.getLogger(__name__)
 class MikrotikAPI:
     """Handle all communication with the Mikrotik API."""
 
+    __slots__ = (
+        "_host",
+        "_use_ssl",
+        "_port",
+        "_username",
+        "_password",
+        "_login_method",
+        "_encoding",
+        "_ssl_wrapper",
+        "lock",
+        "_connection",
+        "_connected",
+        "_reconnected",
+        "_connection_epoch",
+        "_connection_retry_sec",
+        "error",
+        "connection_error_reported",
+        "client_traffic_last_run",
+        "stats",
+    )
+
     def __init__(
         self,
         host,
@@ -51,6 +72,14 @@ class MikrotikAPI:
         self.connection_error_reported = False
         self.client_traffic_last_run = None
 
+        # Lightweight counters for diagnostics
+        self.stats = {
+            "connections": 0,
+            "queries": 0,
+            "batches": 0,
+            "errors": 0,
+        }
+
         # Default ports
         if not self._port:
             self._port = 8729 if self._use_ssl else 8728
@@ -88,6 +117,7 @@ class MikrotikAPI:
         if not error:
             error = "unknown"
 
+        self.stats["errors"] += 1
         if not self.connection_error_reported:
             if location == "unknown":
                 _LOGGER.error("Mikrotik %s connection closed", self._host)
@@ -100,6 +130,12 @@ class MikrotikAPI:
 
         self._reconnected = False
         self._connected = False
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Exception:
+                pass
+
         self._connection = None
         self._connection_epoch = 0
 
@@ -148,6 +184,7 @@ class MikrotikAPI:
 
             self._connected = True
             self._reconnected = True
+            self.stats["connections"] += 1
             self.lock.release()
 
         return self._connected
@@ -184,6 +221,7 @@ class MikrotikAPI:
             return None
 
         self.lock.acquire()
+        self.stats["queries"] += 1
         try:
             _LOGGER.debug("API query: %s", path)
             response = self._connection.path(path)
@@ -211,6 +249,33 @@ class MikrotikAPI:
         self.lock.release()
         return response or None
 
+    # ---------------------------
+    #   query_many
+    # ---------------------------
+    def query_many(self, paths) -> Optional(dict):
+        """Retrieve multiple paths from Mikrotik API in one batch.
+
+        Returns dict of path -> list, or None on connection failure.
+        """
+        if not self.connection_check():
+            return None
+
+        results = {}
+        self.lock.acquire()
+        self.stats["batches"] += 1
+        self.stats["queries"] += len(paths)
+        for path in paths:
+            try:
+                _LOGGER.debug("API batch query: %s", path)
+                results[path] = list(self._connection.path(path))
+            except Exception as e:
+                self.disconnect(f"batch query for path {path}", e)
+                self.lock.release()
+                return None
+
+        self.lock.release()
+        return results
+
     # ---------------------------
     #   set_value
     # ---------------------------
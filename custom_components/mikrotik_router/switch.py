@@ -81,7 +81,9 @@ class MikrotikSwitch(MikrotikEntity, SwitchEntity, RestoreEntity):
         param = self.entity_description.data_reference
         value = self._data[self.entity_description.data_reference]
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
+        await self.hass.async_add_executor_job(
+            self.coordinator.set_value, path, param, value, mod_param, False
+        )
         await self.coordinator.async_refresh()
 
     async def async_turn_off(self) -> None:
@@ -93,7 +95,9 @@ class MikrotikSwitch(MikrotikEntity, SwitchEntity, RestoreEntity):
         param = self.entity_description.data_reference
         value = self._data[self.entity_description.data_reference]
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
+        await self.hass.async_add_executor_job(
+            self.coordinator.set_value, path, param, value, mod_param, True
+        )
         await self.coordinator.async_refresh()
 
 
@@ -152,11 +156,15 @@ class MikrotikPortSwitch(MikrotikSwitch):
             param = "name"
         value = self._data[self.entity_description.data_reference]
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
+        await self.hass.async_add_executor_job(
+            self.coordinator.set_value, path, param, value, mod_param, False
+        )
 
         if "poe-out" in self._data and self._data["poe-out"] == "off":
             path = "/interface/ethernet"
-            self.coordinator.set_value(path, param, value, "poe-out", "auto-on")
+            await self.hass.async_add_executor_job(
+                self.coordinator.set_value, path, param, value, "poe-out", "auto-on"
+            )
 
         await self.coordinator.async_refresh()
 
@@ -174,11 +182,15 @@ class MikrotikPortSwitch(MikrotikSwitch):
             param = "name"
         value = self._data[self.entity_description.data_reference]
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
+        await self.hass.async_add_executor_job(
+            self.coordinator.set_value, path, param, value, mod_param, True
+        )
 
         if "poe-out" in self._data and self._data["poe-out"] == "auto-on":
             path = "/interface/ethernet"
-            self.coordinator.set_value(path, param, value, "poe-out", "off")
+            await self.hass.async_add_executor_job(
+                self.coordinator.set_value, path, param, value, "poe-out", "off"
+            )
 
         await self.coordinator.async_refresh()
 
@@ -206,7 +218,9 @@ class MikrotikNATSwitch(MikrotikSwitch):
                 value = self.coordinator.data["nat"][uid][".id"]
 
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
+        await self.hass.async_add_executor_job(
+            self.coordinator.set_value, path, param, value, mod_param, False
+        )
         await self.coordinator.async_refresh()
 
     async def async_turn_off(self) -> None:
@@ -226,7 +240,9 @@ class MikrotikNATSwitch(MikrotikSwitch):
                 value = self.coordinator.data["nat"][uid][".id"]
 
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
+        await self.hass.async_add_executor_job(
+            self.coordinator.set_value, path, param, value, mod_param, True
+        )
         await self.coordinator.async_refresh()
 
 
@@ -254,7 +270,9 @@ class MikrotikMangleSwitch(MikrotikSwitch):
                 value = self.coordinator.data["mangle"][uid][".id"]
 
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
+        await self.hass.async_add_executor_job(
+            self.coordinator.set_value, path, param, value, mod_param, False
+        )
         await self.coordinator.async_refresh()
 
     async def async_turn_off(self) -> None:
@@ -275,7 +293,9 @@ class MikrotikMangleSwitch(MikrotikSwitch):
                 value = self.coordinator.data["mangle"][uid][".id"]
 
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
+        await self.hass.async_add_executor_job(
+            self.coordinator.set_value, path, param, value, mod_param, True
+        )
         await self.coordinator.async_refresh()
 
 
@@ -302,7 +322,9 @@ class MikrotikFilterSwitch(MikrotikSwitch):
                 value = self.coordinator.data["filter"][uid][".id"]
 
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
+        await self.hass.async_add_executor_job(
+            self.coordinator.set_value, path, param, value, mod_param, False
+        )
         await self.coordinator.async_refresh()
 
     async def async_turn_off(self) -> None:
@@ -322,7 +344,9 @@ class MikrotikFilterSwitch(MikrotikSwitch):
                 value = self.coordinator.data["filter"][uid][".id"]
 
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
+        await self.hass.async_add_executor_job(
+            self.coordinator.set_value, path, param, value, mod_param, True
+        )
         await self.coordinator.async_refresh()
 
 
@@ -345,7 +369,9 @@ class MikrotikQueueSwitch(MikrotikSwitch):
                 value = self.coordinator.data["queue"][uid][".id"]
 
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, False)
+        await self.hass.async_add_executor_job(
+            self.coordinator.set_value, path, param, value, mod_param, False
+        )
         await self.coordinator.async_refresh()
 
     async def async_turn_off(self) -> None:
@@ -361,7 +387,9 @@ class MikrotikQueueSwitch(MikrotikSwitch):
                 value = self.coordinator.data["queue"][uid][".id"]
 
         mod_param = self.entity_description.data_switch_parameter
-        self.coordinator.set_value(path, param, value, mod_param, True)
+        await self.hass.async_add_executor_job(
+            self.coordinator.set_value, path, param, value, mod_param, True
+        )
         await self.coordinator.async_refresh()
 
 
@@ -380,7 +408,9 @@ class MikrotikKidcontrolPauseSwitch(MikrotikSwitch):
         param = self.entity_description.data_reference
         value = self._data[self.entity_description.data_reference]
         command = "resume"
-        self.coordinator.execute(path, command, param, value)
+        await self.hass.async_add_executor_job(
+            self.coordinator.execute, path, command, param, value
+        )
         await self.coordinator.async_refresh()
 
     async def async_turn_off(self) -> None:
@@ -392,5 +422,7 @@ class MikrotikKidcontrolPauseSwitch(MikrotikSwitch):
         param = self.entity_description.data_reference
         value = self._data[self.entity_description.data_reference]
         command = "pause"
-        self.coordinator.execute(path, command, param, value)
+        await self.hass.async_add_executor_job(
+            self.coordinator.execute, path, command, param, value
+        )
         await self.coordinator.async_refresh()
@@ -1,6 +1,7 @@
 """Support for the Mikrotik Router update service."""
 from __future__ import annotations
 
+from datetime import datetime
 from logging import getLogger
 from requests import get as requests_get
 from typing import Any
@@ -83,9 +84,16 @@ class MikrotikRouterOSUpdate(MikrotikEntity, UpdateEntity):
     async def async_install(self, version: str, backup: bool, **kwargs: Any) -> None:
         """Install an update."""
         if backup:
-            self.coordinator.execute("/system/backup", "save", None, None)
+            await self.hass.async_add_executor_job(
+                self.coordinator.execute, "/system/backup", "save", None, None
+            )
+
+        await self.hass.async_add_executor_job(
+            self.coordinator.execute, "/system/package/update", "install", None, None
+        )
 
-        self.coordinator.execute("/system/package/update", "install", None, None)
+        # Expire the check-for-updates cache so state refreshes after reboot
+        self.coordinator.last_fwupdate_check = datetime(1970, 1, 1)
 
     async def async_release_notes(self) -> str:
         """Return the release notes."""
@@ -153,5 +161,12 @@ class MikrotikRouterBoardFWUpdate(MikrotikEntity, UpdateEntity):
 
     async def async_install(self, version: str, backup: bool, **kwargs: Any) -> None:
         """Install an update."""
-        self.coordinator.execute("/system/routerboard", "upgrade", None, None)
-        self.coordinator.execute("/system", "reboot", None, None)
+        await self.hass.async_add_executor_job(
+            self.coordinator.execute, "/system/routerboard", "upgrade", None, None
+        )
+        await self.hass.async_add_executor_job(
+            self.coordinator.execute, "/system", "reboot", None, None
+        )
+
+        # Expire the check-for-updates cache so state refreshes after reboot
+        self.coordinator.last_fwupdate_check = datetime(1970, 1, 1)